@@ -8,12 +8,49 @@ from CSV files to learn patterns and structure.
 import logging
 import csv
 import pandas as pd
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, TextIO, Union
 import re
+from collections import Counter
+from itertools import chain
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Step number prefix ("1.") at the start of a line
+_STEP_NUMBER_RE = re.compile(r'^\s*\d+\.', re.MULTILINE)
+
+# Body of each numbered step ("1. ...") up to the next number or end of text
+_NUMBERED_STEP_RE = re.compile(r'^\s*\d+\.\s*(.*?)(?=^\s*\d+\.|\Z)', re.MULTILINE | re.DOTALL)
+
+# Verbs tracked by the linguistic style analysis, in reporting order
+_COMMON_VERBS = ('verify', 'check', 'ensure', 'click', 'select', 'enter', 'navigate', 'open', 'close', 'save')
+_WORD_RE = re.compile(r'\w+')
+
+# Keywords that identify each test type, in reporting order
+_TEST_TYPE_PATTERNS = (
+    ('happy_path', re.compile(r'\b(?:normal|standard|typical|happy path)\b', re.IGNORECASE)),
+    ('boundary_conditions', re.compile(r'\b(?:boundary|limit|maximum|minimum|min|max)\b', re.IGNORECASE)),
+    ('error_cases', re.compile(r'\b(?:error|exception|fail|invalid|negative)\b', re.IGNORECASE)),
+)
+
+# Preconditions are listed one per line or separated by semicolons
+_PRECONDITION_SPLIT_RE = re.compile(r'[\n;]')
+
+# Joins steps for batch normalization; any occurrence inside a step is
+# replaced with a space before joining so it cannot split the step
+_STEP_SEPARATOR = '\x1e'
+
+# Quoted text or a standalone number, masked in one pass. Quotes are tried
+# first so digits inside them are swallowed with the quote, and cannot span
+# the step separator.
+_STEP_DETAIL_RE = re.compile(r'"[^"\x1e]*"|\b\d+\b')
+
+
+def _mask_step_detail(match: re.Match) -> str:
+    """Replace a quoted value with "..." and a number with X."""
+    return '"..."' if match.group(0)[0] == '"' else 'X'
+
+
 class TestCaseParser:
     """
     Parser for test case CSV files.
@@ -28,12 +65,12 @@ class TestCaseParser:
         """Initialize the test case parser."""
         logger.debug("Initializing test case parser")
     
-    def parse(self, file_path: str) -> pd.DataFrame:
+    def parse(self, file_path: Union[str, TextIO]) -> pd.DataFrame:
         """
         Parse a CSV file containing test cases.
         
         Args:
-            file_path: Path to the CSV file
+            file_path: Path to the CSV file, or an open text file object
             
         Returns:
             DataFrame containing the test cases
@@ -41,8 +78,9 @@ class TestCaseParser:
         logger.info(f"Parsing test case CSV: {file_path}")
         
         try:
-            # Read CSV into pandas DataFrame
-            df = pd.read_csv(file_path)
+            # Read CSV into pandas DataFrame, replacing undecodable bytes
+            # instead of failing on exports from legacy code pages
+            df = pd.read_csv(file_path, encoding_errors='replace')
             
             # Log basic information about the data
             logger.info(f"Loaded {len(df)} test cases with {len(df.columns)} columns")
@@ -125,12 +163,8 @@ class TestCaseParser:
         Returns:
             Average number of steps per test case
         """
-        # Try to find steps column
-        steps_col = None
-        for col in df.columns:
-            if any(term in col.lower() for term in ['step', 'test step', 'teststep']):
-                steps_col = col
-                break
+        # Try to find steps column ('step' covers 'test step' and 'teststep')
+        steps_col = next((col for col in df.columns if 'step' in col.lower()), None)
         
         if not steps_col:
             logger.warning("Could not identify steps column")
@@ -139,11 +173,9 @@ class TestCaseParser:
         # Count steps in each test case
         step_counts = []
         
-        for _, row in df.iterrows():
-            steps_text = str(row[steps_col])
-            
+        for steps_text in df[steps_col].map(str):
             # Try to count numbered steps (e.g., "1. Step one\n2. Step two")
-            step_matches = re.findall(r'^\s*\d+\.', steps_text, re.MULTILINE)
+            step_matches = _STEP_NUMBER_RE.findall(steps_text)
             if step_matches:
                 step_counts.append(len(step_matches))
             else:
@@ -158,13 +190,41 @@ class TestCaseParser:
         
         return 0
     
-    def analyze_linguistic_style(self, df: pd.DataFrame, key_columns: Dict) -> Dict:
+    def split_steps(self, df: pd.DataFrame, steps_col: str) -> pd.Series:
+        """
+        Split the steps column into individual step strings, per test case.
+        
+        Callers that run both analyze_linguistic_style and extract_patterns
+        can split once and pass the result to each.
+        
+        Args:
+            df: DataFrame containing test cases
+            steps_col: Name of the steps column
+            
+        Returns:
+            Series aligned with df holding a list of stripped steps per row
+        """
+        def split_one(steps_text: str) -> List[str]:
+            # Try to split by numbered steps
+            step_matches = _NUMBERED_STEP_RE.findall(steps_text)
+            if step_matches:
+                return [step.strip() for step in step_matches]
+            # If no numbered steps, split by newlines
+            return [step.strip() for step in steps_text.split('\n') if step.strip()]
+        
+        return df[steps_col].map(str).map(split_one)
+    
+    def analyze_linguistic_style(self,
+                                 df: pd.DataFrame,
+                                 key_columns: Dict,
+                                 step_lists: Optional[pd.Series] = None) -> Dict:
         """
         Analyze the linguistic style of test cases.
         
         Args:
             df: DataFrame containing test cases
             key_columns: Dictionary mapping column roles to column names
+            step_lists: Result of split_steps for df, computed if not given
             
         Returns:
             Dictionary with linguistic style analysis
@@ -180,36 +240,27 @@ class TestCaseParser:
         
         # Analyze steps if available
         if 'steps' in key_columns:
-            steps_col = key_columns['steps']
-            all_steps = []
+            if step_lists is None:
+                step_lists = self.split_steps(df, key_columns['steps'])
+            all_steps = list(chain.from_iterable(step_lists))
+            
+            # Accumulate step length and verb usage in a single pass
+            total_length = 0
+            verb_counts = Counter()
             
-            # Extract individual steps
-            for _, row in df.iterrows():
-                steps_text = str(row[steps_col])
+            for step in all_steps:
+                total_length += len(step)
                 
-                # Try to split by numbered steps
-                step_matches = re.findall(r'^\s*\d+\.\s*(.*?)(?=^\s*\d+\.|\Z)', steps_text, re.MULTILINE | re.DOTALL)
-                if step_matches:
-                    all_steps.extend([step.strip() for step in step_matches])
-                else:
-                    # If no numbered steps, split by newlines
-                    all_steps.extend([step.strip() for step in steps_text.split('\n') if step.strip()])
+                # Tokenize once, then each verb is a set lookup
+                words = set(_WORD_RE.findall(step.lower()))
+                verb_counts.update(verb for verb in _COMMON_VERBS if verb in words)
             
             # Calculate average step length
             if all_steps:
-                style_analysis['average_step_length'] = sum(len(step) for step in all_steps) / len(all_steps)
-            
-            # Extract common verbs
-            verb_counts = {}
-            common_verbs = ['verify', 'check', 'ensure', 'click', 'select', 'enter', 'navigate', 'open', 'close', 'save']
-            
-            for step in all_steps:
-                for verb in common_verbs:
-                    if re.search(r'\b' + verb + r'\b', step.lower()):
-                        verb_counts[verb] = verb_counts.get(verb, 0) + 1
+                style_analysis['average_step_length'] = total_length / len(all_steps)
             
             # Sort verbs by frequency
-            style_analysis['common_verbs'] = dict(sorted(verb_counts.items(), key=lambda x: x[1], reverse=True))
+            style_analysis['common_verbs'] = dict(verb_counts.most_common())
             
             # Determine tone based on verb usage
             if style_analysis['common_verbs'].get('verify', 0) > style_analysis['common_verbs'].get('check', 0):
@@ -220,13 +271,17 @@ class TestCaseParser:
         logger.debug(f"Linguistic style analysis: {style_analysis}")
         return style_analysis
     
-    def extract_patterns(self, df: pd.DataFrame, key_columns: Dict) -> List[Dict]:
+    def extract_patterns(self,
+                         df: pd.DataFrame,
+                         key_columns: Dict,
+                         step_lists: Optional[pd.Series] = None) -> List[Dict]:
         """
         Extract test patterns from existing test cases.
         
         Args:
             df: DataFrame containing test cases
             key_columns: Dictionary mapping column roles to column names
+            step_lists: Result of split_steps for df, computed if not given
             
         Returns:
             List of extracted patterns
@@ -235,6 +290,10 @@ class TestCaseParser:
         
         patterns = []
         
+        # Split steps once for the whole frame; groups take their rows from it
+        if step_lists is None and 'steps' in key_columns:
+            step_lists = self.split_steps(df, key_columns['steps'])
+        
         # Group test cases by requirement if possible
         if 'requirement_id' in key_columns:
             req_col = key_columns['requirement_id']
@@ -249,7 +308,9 @@ class TestCaseParser:
                     'test_count': len(group),
                     'test_types': self._identify_test_types(group, key_columns),
                     'common_preconditions': self._extract_common_preconditions(group, key_columns),
-                    'common_steps': self._extract_common_steps(group, key_columns),
+                    'common_steps': self._extract_common_steps(
+                        step_lists.loc[group.index] if step_lists is not None else None
+                    ),
                     'examples': self._extract_examples(group, key_columns)
                 }
                 
@@ -262,7 +323,7 @@ class TestCaseParser:
                 'test_count': len(df),
                 'test_types': self._identify_test_types(df, key_columns),
                 'common_preconditions': self._extract_common_preconditions(df, key_columns),
-                'common_steps': self._extract_common_steps(df, key_columns),
+                'common_steps': self._extract_common_steps(step_lists),
                 'examples': self._extract_examples(df, key_columns)
             }
             
@@ -280,19 +341,12 @@ class TestCaseParser:
         results_col = key_columns.get('expected_results')
         
         if steps_col:
-            steps_text = ' '.join(df[steps_col].astype(str))
-            
-            # Check for happy path tests
-            if re.search(r'\b(normal|standard|typical|happy path)\b', steps_text, re.IGNORECASE):
-                test_types.append('happy_path')
+            steps_text = ' '.join(df[steps_col].map(str))
             
-            # Check for boundary tests
-            if re.search(r'\b(boundary|limit|maximum|minimum|min|max)\b', steps_text, re.IGNORECASE):
-                test_types.append('boundary_conditions')
-            
-            # Check for error tests
-            if re.search(r'\b(error|exception|fail|invalid|negative)\b', steps_text, re.IGNORECASE):
-                test_types.append('error_cases')
+            # Check for happy path, boundary and error tests
+            for test_type, pattern in _TEST_TYPE_PATTERNS:
+                if pattern.search(steps_text):
+                    test_types.append(test_type)
         
         # If no specific types identified, assume happy path
         if not test_types:
@@ -306,19 +360,16 @@ class TestCaseParser:
             return []
         
         preconditions_col = key_columns['preconditions']
-        all_preconditions = df[preconditions_col].astype(str).tolist()
         
-        # Find common preconditions by frequency
-        precondition_counts = {}
-        for precondition in all_preconditions:
-            if pd.isna(precondition) or not precondition.strip():
-                continue
-            
-            # Split by newlines or semicolons
-            for item in re.split(r'[\n;]', precondition):
-                item = item.strip()
-                if item:
-                    precondition_counts[item] = precondition_counts.get(item, 0) + 1
+        # Find common preconditions by frequency, splitting each cell by
+        # newlines or semicolons and counting items as they are produced
+        precondition_counts = Counter(
+            item
+            for precondition in df[preconditions_col].astype(str)
+            if not pd.isna(precondition)
+            for item in map(str.strip, _PRECONDITION_SPLIT_RE.split(precondition))
+            if item
+        )
         
         # Return preconditions that appear in at least 30% of test cases
         threshold = 0.3 * len(df)
@@ -326,37 +377,24 @@ class TestCaseParser:
         
         return common_preconditions
     
-    def _extract_common_steps(self, df: pd.DataFrame, key_columns: Dict) -> List[str]:
-        """Extract common steps from test cases."""
-        if 'steps' not in key_columns:
+    def _extract_common_steps(self, step_lists: Optional[pd.Series]) -> List[str]:
+        """Extract common steps from the split steps of a group of test cases."""
+        if step_lists is None:
             return []
         
-        steps_col = key_columns['steps']
-        all_steps = []
+        all_steps = chain.from_iterable(step_lists)
         
-        # Extract individual steps
-        for _, row in df.iterrows():
-            steps_text = str(row[steps_col])
-            
-            # Try to split by numbered steps
-            step_matches = re.findall(r'^\s*\d+\.\s*(.*?)(?=^\s*\d+\.|\Z)', steps_text, re.MULTILINE | re.DOTALL)
-            if step_matches:
-                all_steps.extend([step.strip() for step in step_matches])
-            else:
-                # If no numbered steps, split by newlines
-                all_steps.extend([step.strip() for step in steps_text.split('\n') if step.strip()])
+        # Normalize all steps in one regex pass per substitution by joining
+        # them on a record separator, which neither pattern can match across
+        joined = _STEP_SEPARATOR.join(
+            step.replace(_STEP_SEPARATOR, ' ') for step in all_steps if step.strip()
+        )
+        if not joined:
+            return []
+        joined = _STEP_DETAIL_RE.sub(_mask_step_detail, joined)
         
         # Find common steps by frequency
-        step_counts = {}
-        for step in all_steps:
-            if not step.strip():
-                continue
-            
-            # Normalize step by removing specific details
-            normalized_step = re.sub(r'\b\d+\b', 'X', step)  # Replace numbers with X
-            normalized_step = re.sub(r'"[^"]*"', '"..."', normalized_step)  # Replace quoted text
-            
-            step_counts[normalized_step] = step_counts.get(normalized_step, 0) + 1
+        step_counts = Counter(joined.split(_STEP_SEPARATOR))
         
         # Return steps that appear multiple times
         threshold = 2
@@ -372,14 +410,13 @@ class TestCaseParser:
         sample_size = min(3, len(df))
         sample_df = df.sample(n=sample_size) if len(df) > sample_size else df
         
-        for _, row in sample_df.iterrows():
-            example = {}
-            
-            # Extract key fields
-            for role, col in key_columns.items():
-                if col in row:
-                    example[role] = row[col]
-            
-            examples.append(example)
+        # Resolve which key columns are present once, not per row
+        present_columns = {
+            role: col for role, col in key_columns.items() if col in sample_df.columns
+        }
+        
+        # Extract key fields
+        for record in sample_df.to_dict('records'):
+            examples.append({role: record[col] for role, col in present_columns.items()})
         
         return examples
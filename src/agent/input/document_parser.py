@@ -5,14 +5,51 @@ This module provides parsers for different document formats (DOCX, PDF, text)
 to extract requirements from SRS documents.
 """
 
+import hashlib
 import logging
 import re
 import os
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, TextIO, Union
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Pattern for requirement IDs (e.g., REQ-001, R-123, etc.)
+_REQUIREMENT_ID_RE = re.compile(r'(?:REQ|R)-\d+')
+
+# Blank lines separate candidate requirement sections
+_SECTION_SPLIT_RE = re.compile(r'\n\s*\n')
+
+# Words that mark an unnumbered section as a requirement (substring match)
+_REQUIREMENT_KEYWORD_RE = re.compile(r'shall|must|should|will|requires', re.IGNORECASE)
+
+# Tag keywords, in the order tags are reported
+_TAG_KEYWORDS = (
+    ('critical', ('critical', 'essential', 'mandatory')),
+    ('important', ('important', 'significant')),
+    ('ui', ('user interface', 'ui')),
+    ('data', ('database', 'data')),
+    ('security', ('security', 'authentication')),
+)
+
+# One named-group alternation so a single scan finds every tag
+_TAG_RE = re.compile(
+    '|'.join(
+        rf"(?P<{tag}>\b(?:{'|'.join(map(re.escape, keywords))})\b)"
+        for tag, keywords in _TAG_KEYWORDS
+    ),
+    re.IGNORECASE
+)
+
+# LRU cache of parsed requirements keyed by a digest of the document text
+_REQUIREMENTS_CACHE_SIZE = 32
+_REQUIREMENTS_CACHE = OrderedDict()
+
+def _clear_requirements_cache():
+    """Drop all memoized requirement lists (e.g. between tests)."""
+    _REQUIREMENTS_CACHE.clear()
+
 class DocumentParser:
     """
     Base class for document parsers.
@@ -41,6 +78,36 @@ class DocumentParser:
         """
         Extract requirements from text using regex patterns.
         
+        Results are memoized by a digest of the text, so re-parsing the same
+        document (e.g. once per target platform) skips the regex pass.
+        
+        Args:
+            text: The text to extract requirements from
+            
+        Returns:
+            List of requirement dictionaries
+        """
+        digest = hashlib.blake2b(
+            text.encode('utf-8', 'surrogatepass'), digest_size=16
+        ).digest()
+        
+        cached = _REQUIREMENTS_CACHE.get(digest)
+        if cached is None:
+            cached = self._parse_requirements(text)
+            _REQUIREMENTS_CACHE[digest] = cached
+            if len(_REQUIREMENTS_CACHE) > _REQUIREMENTS_CACHE_SIZE:
+                _REQUIREMENTS_CACHE.popitem(last=False)
+        else:
+            _REQUIREMENTS_CACHE.move_to_end(digest)
+            logger.debug(f"Reusing {len(cached)} cached requirements")
+        
+        # Hand out copies so callers cannot mutate the cached entries
+        return [{**req, 'tags': list(req['tags'])} for req in cached]
+    
+    def _parse_requirements(self, text: str) -> List[Dict]:
+        """
+        Split text into sections and build a requirement from each match.
+        
         Args:
             text: The text to extract requirements from
             
@@ -50,22 +117,18 @@ class DocumentParser:
         logger.debug("Extracting requirements from text")
         requirements = []
         
-        # Pattern for requirement IDs (e.g., REQ-001, R-123, etc.)
-        id_pattern = r'(?:REQ|R)-\d+'
-        
         # Split text into sections that might contain requirements
-        sections = re.split(r'\n\s*\n', text)
+        sections = _SECTION_SPLIT_RE.split(text)
         
         for section in sections:
             # Try to find a requirement ID
-            id_match = re.search(id_pattern, section)
+            id_match = _REQUIREMENT_ID_RE.search(section)
             req_id = id_match.group(0) if id_match else None
             
             # If no ID found, try to determine if this is a requirement by keywords
             is_requirement = False
             if not req_id:
-                requirement_keywords = ['shall', 'must', 'should', 'will', 'requires']
-                if any(keyword in section.lower() for keyword in requirement_keywords):
+                if _REQUIREMENT_KEYWORD_RE.search(section):
                     is_requirement = True
                     req_id = f"REQ-AUTO-{len(requirements) + 1:03d}"
             
@@ -99,21 +162,13 @@ class DocumentParser:
         Returns:
             List of tags
         """
-        tags = []
+        found = {match.lastgroup for match in _TAG_RE.finditer(text)}
         
-        # Check for criticality indicators
-        if any(word in text.lower() for word in ['critical', 'essential', 'mandatory']):
-            tags.append('critical')
-        elif any(word in text.lower() for word in ['important', 'significant']):
-            tags.append('important')
+        # Criticality levels are exclusive; 'critical' wins over 'important'
+        if 'critical' in found:
+            found.discard('important')
         
-        # Check for functional areas
-        if 'user interface' in text.lower() or 'ui' in text.lower():
-            tags.append('ui')
-        if 'database' in text.lower() or 'data' in text.lower():
-            tags.append('data')
-        if 'security' in text.lower() or 'authentication' in text.lower():
-            tags.append('security')
+        tags = [tag for tag, _ in _TAG_KEYWORDS if tag in found]
         
         return tags
 
@@ -211,20 +266,27 @@ class PdfParser(DocumentParser):
 class TextParser(DocumentParser):
     """Parser for plain text documents."""
     
-    def parse(self, file_path: str) -> List[Dict]:
+    def parse(self, file_path: Union[str, TextIO]) -> List[Dict]:
         """
         Parse a text document and extract requirements.
         
         Args:
-            file_path: Path to the text document
+            file_path: Path to the text document, or an open text file object
             
         Returns:
             List of requirement dictionaries
         """
+        # Already-open streams (e.g. io.StringIO) are read directly
+        if hasattr(file_path, 'read'):
+            logger.info("Parsing text document from stream")
+            return self._extract_requirements(file_path.read())
+        
         logger.info(f"Parsing text document: {file_path}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
+            # Decode in a single pass; stray non-UTF-8 bytes are replaced
+            # rather than failing the whole document
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
                 document_text = file.read()
                 
                 # Extract requirements from the text
@@ -235,6 +297,16 @@ class TextParser(DocumentParser):
             raise
 
 
+# Parser class per file extension; anything else is read as plain text
+_PARSER_REGISTRY = {
+    '.docx': DocxParser,
+    '.pdf': PdfParser,
+    '.txt': TextParser
+}
+
+# Parsers hold no per-document state, so one instance per class is shared
+_PARSER_INSTANCES = {}
+
 def get_parser_for_file(file_path: str) -> DocumentParser:
     """
     Get the appropriate parser for a file based on its extension.
@@ -243,14 +315,12 @@ def get_parser_for_file(file_path: str) -> DocumentParser:
         file_path: Path to the document
         
     Returns:
-        An instance of the appropriate DocumentParser subclass
+        A shared instance of the appropriate DocumentParser subclass
     """
-    _, ext = os.path.splitext(file_path)
-    ext = ext.lower()
+    ext = os.path.splitext(file_path)[1].lower()
+    parser_class = _PARSER_REGISTRY.get(ext, TextParser)
     
-    if ext == '.docx':
-        return DocxParser()
-    elif ext == '.pdf':
-        return PdfParser()
-    else:
-        return TextParser()
+    parser = _PARSER_INSTANCES.get(parser_class)
+    if parser is None:
+        parser = _PARSER_INSTANCES[parser_class] = parser_class()
+    return parser
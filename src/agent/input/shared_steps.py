@@ -6,10 +6,11 @@ in test case generation.
 """
 
 import logging
-import json
 import os
 from typing import Dict, List, Optional, Any
 
+import orjson
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -52,14 +53,15 @@ class SharedStepsManager:
                 if filename.endswith('.json'):
                     file_path = os.path.join(self.shared_steps_dir, filename)
                     
-                    with open(file_path, 'r') as f:
-                        shared_step = json.load(f)
-                        
-                        # Add to the dictionary
-                        step_id = shared_step.get('id')
-                        if step_id:
-                            self.shared_steps[step_id] = shared_step
-                            logger.debug(f"Loaded shared step: {step_id}")
+                    with open(file_path, 'rb') as f:
+                        data = f.read()
+                    shared_step = orjson.loads(data)
+                    
+                    # Add to the dictionary
+                    step_id = shared_step.get('id')
+                    if step_id:
+                        self.shared_steps[step_id] = shared_step
+                        logger.debug(f"Loaded shared step: {step_id}")
             
             logger.info(f"Loaded {len(self.shared_steps)} shared steps")
             
@@ -117,8 +119,8 @@ class SharedStepsManager:
             
             # Save to file
             file_path = os.path.join(self.shared_steps_dir, f"{shared_step['id']}.json")
-            with open(file_path, 'w') as f:
-                json.dump(shared_step, f, indent=2)
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(shared_step, option=orjson.OPT_INDENT_2))
                 
             logger.debug(f"Saved shared step to {file_path}")
             
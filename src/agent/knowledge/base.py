@@ -6,6 +6,7 @@ machine-specific information, and examples for test generation.
 """
 
 import logging
+from itertools import islice
 from typing import Dict, List, Optional, Any
 
 # Setup logging
@@ -116,12 +117,9 @@ class KnowledgeRepository:
             logger.warning(f"Adding information for unknown machine type: {machine_type}")
             self.machine_contexts[machine_type] = self._initialize_machine_context(machine_type)
         
-        # Add version-specific information if it doesn't exist
-        if version not in self.machine_contexts[machine_type]['versions']:
-            self.machine_contexts[machine_type]['versions'][version] = {}
-        
-        # Update with new information
-        self.machine_contexts[machine_type]['versions'][version].update(info)
+        # Add version-specific information (created on first use)
+        versions = self.machine_contexts[machine_type]['versions']
+        versions.setdefault(version, {}).update(info)
         
         logger.debug(f"Updated information for {machine_type} version {version}")
     
@@ -164,22 +162,20 @@ class KnowledgeRepository:
         # In a real implementation, this would use more sophisticated
         # matching techniques to find the most relevant examples
         
-        filtered_examples = [
+        # Lazily filtered so the scan stops once `limit` matches are found
+        filtered_examples = (
             ex for ex in self.examples 
             if machine_type in ex.get('tags', []) and version in ex.get('tags', [])
-        ]
+        )
         
         # Further filter by similarity to requirement (placeholder implementation)
         # Would use NLP or other techniques in a real implementation
         
         # Convert to formatted strings
-        result = []
-        for ex in filtered_examples[:limit]:
-            # Format the example as a string
-            example_text = self._format_example(ex['example'])
-            result.append(example_text)
-        
-        return result
+        return [
+            self._format_example(ex['example'])
+            for ex in islice(filtered_examples, limit)
+        ]
     
     def _format_example(self, example: Dict) -> str:
         """Format an example test case as a string."""
@@ -11,6 +11,26 @@ from typing import Dict, List, Optional, Any
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Placeholder focus areas and suggested steps, shared across all plans
+_FOCUS_AREAS = ('Core functionality',)
+_BOUNDARY_CONDITIONS = ('Min/max values', 'Empty/full states')
+_POTENTIAL_ERRORS = ('Invalid input', 'System unavailable')
+_HAPPY_PATH_STEPS = (
+    'Setup initial conditions',
+    'Perform main action',
+    'Verify expected outcome'
+)
+_BOUNDARY_STEPS = (
+    'Setup boundary condition',
+    'Perform action at boundary',
+    'Verify behavior at boundary'
+)
+_ERROR_STEPS = (
+    'Setup error condition',
+    'Attempt action that will cause error',
+    'Verify proper error handling'
+)
+
 class ReasoningEngine:
     """
     Reasoning engine for test generation decisions.
@@ -58,8 +78,9 @@ class ReasoningEngine:
         
         # Simple heuristic based on length and keywords
         word_count = len(description.split())
-        has_conditions = 'if' in description.lower() or 'when' in description.lower()
-        has_multiple_steps = 'then' in description.lower() or ';' in description
+        description_lower = description.lower()
+        has_conditions = 'if' in description_lower or 'when' in description_lower
+        has_multiple_steps = 'then' in description_lower or ';' in description
         
         if word_count > 100 or (has_conditions and has_multiple_steps):
             complexity = 'high'
@@ -158,19 +179,19 @@ class ReasoningEngine:
         """Extract key focus areas for testing from the requirement."""
         # This would use NLP to identify key areas to focus on
         # Placeholder implementation
-        return ['Core functionality']
+        return list(_FOCUS_AREAS)
     
     def _extract_boundary_conditions(self, requirement: Dict) -> List[str]:
         """Extract potential boundary conditions from the requirement."""
         # This would use NLP to identify boundary conditions
         # Placeholder implementation
-        return ['Min/max values', 'Empty/full states']
+        return list(_BOUNDARY_CONDITIONS)
     
     def _extract_potential_errors(self, requirement: Dict) -> List[str]:
         """Extract potential error scenarios from the requirement."""
         # This would use NLP to identify potential error conditions
         # Placeholder implementation
-        return ['Invalid input', 'System unavailable']
+        return list(_POTENTIAL_ERRORS)
     
     def _suggest_steps_for_happy_path(self, 
                                      requirement: Dict, 
@@ -178,33 +199,21 @@ class ReasoningEngine:
         """Suggest steps for a happy path test case."""
         # This would analyze the requirement and patterns to suggest steps
         # Placeholder implementation
-        return [
-            'Setup initial conditions',
-            'Perform main action',
-            'Verify expected outcome'
-        ]
+        return list(_HAPPY_PATH_STEPS)
     
     def _suggest_steps_for_boundaries(self, 
                                      requirement: Dict, 
                                      patterns: List[Dict]) -> List[str]:
         """Suggest steps for a boundary conditions test case."""
         # Placeholder implementation
-        return [
-            'Setup boundary condition',
-            'Perform action at boundary',
-            'Verify behavior at boundary'
-        ]
+        return list(_BOUNDARY_STEPS)
     
     def _suggest_steps_for_errors(self, 
                                  requirement: Dict, 
                                  patterns: List[Dict]) -> List[str]:
         """Suggest steps for an error handling test case."""
         # Placeholder implementation
-        return [
-            'Setup error condition',
-            'Attempt action that will cause error',
-            'Verify proper error handling'
-        ]
+        return list(_ERROR_STEPS)
     
     def resolve_conflicts(self, 
                          requirement: Dict, 
@@ -9,15 +9,19 @@ import argparse
 import logging
 import os
 import sys
-import json
 from typing import Dict
+import orjson
 from dotenv import load_dotenv
 
 # Import the agent components
 from agent.core.agent import TestGenerationAgent
 
 def configure_logging(verbose: bool = False):
-    """Configure the logging system."""
+    """Configure the logging system (only the first call has any effect)."""
+    root_logger = logging.getLogger()
+    if getattr(root_logger, '_configured', False):
+        return
+
     log_level = logging.DEBUG if verbose else logging.INFO
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
@@ -26,9 +30,11 @@ def configure_logging(verbose: bool = False):
         format=log_format,
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler('test_generation.log')
+            # delay=True: the log file is only opened on the first record
+            logging.FileHandler('test_generation.log', encoding='utf-8', delay=True)
         ]
     )
+    root_logger._configured = True
 
 def load_config(config_path: str = None) -> Dict:
     """
@@ -53,9 +59,10 @@ def load_config(config_path: str = None) -> Dict:
     
     # Load config from file if provided
     if config_path and os.path.exists(config_path):
-        with open(config_path, 'r') as f:
-            file_config = json.load(f)
-            config.update(file_config)
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        file_config = orjson.loads(data)
+        config.update(file_config)
     
     return config
 
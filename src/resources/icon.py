@@ -1,49 +1,48 @@
 """
 Script to generate a simple icon for the application.
+
+This is a one-off developer tool and needs Pillow, which is not part of
+requirements.txt; install it separately with: pip install Pillow
 """
 
-import tkinter as tk
 import os
 
-def create_icon():
+def create_icon(icon_path: str = "resources/icon.ico"):
     """Create a simple icon and save it as a .ico file."""
-    # Create a root window
-    root = tk.Tk()
-    root.title("Icon Generator")
-    
-    # Create a canvas
-    canvas = tk.Canvas(root, width=64, height=64, bg="white")
-    canvas.pack()
-    
+    try:
+        # Import here so the rest of the app does not depend on Pillow
+        from PIL import Image, ImageDraw
+    except ImportError:
+        print("Pillow package not installed. Install with: pip install Pillow")
+        raise
+
+    # Create a transparent canvas
+    image = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+
     # Draw a simple test case icon
     # Background
-    canvas.create_rectangle(4, 4, 60, 60, fill="#3498db", outline="#2980b9", width=2)
-    
+    draw.rectangle((4, 4, 60, 60), fill="#3498db", outline="#2980b9", width=2)
+
     # Document lines
-    canvas.create_rectangle(12, 12, 52, 52, fill="white", outline="#2980b9", width=1)
-    canvas.create_line(16, 20, 48, 20, fill="#7f8c8d", width=1)
-    canvas.create_line(16, 28, 48, 28, fill="#7f8c8d", width=1)
-    canvas.create_line(16, 36, 48, 36, fill="#7f8c8d", width=1)
-    canvas.create_line(16, 44, 48, 44, fill="#7f8c8d", width=1)
-    
+    draw.rectangle((12, 12, 52, 52), fill="white", outline="#2980b9", width=1)
+    draw.line((16, 20, 48, 20), fill="#7f8c8d", width=1)
+    draw.line((16, 28, 48, 28), fill="#7f8c8d", width=1)
+    draw.line((16, 36, 48, 36), fill="#7f8c8d", width=1)
+    draw.line((16, 44, 48, 44), fill="#7f8c8d", width=1)
+
     # Checkmark
-    canvas.create_line(24, 32, 30, 38, fill="#27ae60", width=3)
-    canvas.create_line(30, 38, 40, 24, fill="#27ae60", width=3)
-    
-    # Save as PostScript first (tkinter doesn't directly support saving as .ico)
-    ps_file = "resources/icon.ps"
-    canvas.postscript(file=ps_file, colormode="color")
-    
-    print(f"Icon saved as {ps_file}")
-    print("You'll need to convert this to .ico format using an external tool.")
-    
-    # Close the window
-    root.after(1000, root.destroy)
-    root.mainloop()
+    draw.line((24, 32, 30, 38), fill="#27ae60", width=3)
+    draw.line((30, 38, 40, 24), fill="#27ae60", width=3)
+
+    # Save directly in .ico format
+    image.save(icon_path, format="ICO", sizes=[(64, 64)])
+
+    print(f"Icon saved as {icon_path}")
 
 if __name__ == "__main__":
     # Create the resources directory if it doesn't exist
     os.makedirs("resources", exist_ok=True)
-    
+
     # Create the icon
     create_icon()
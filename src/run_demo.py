@@ -4,23 +4,34 @@ Demo script to run the test generation system with sample data.
 
 import os
 import sys
+import atexit
 import logging
 import argparse
-from dotenv import load_dotenv
-
-# Import the agent
-from agent.core.agent import TestGenerationAgent
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 def configure_logging():
-    """Configure logging for the demo."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('demo.log')
-        ]
-    )
+    """
+    Configure logging for the demo.
+
+    Records are put on a queue by the root logger and written to the
+    console and demo.log by a background listener thread, so logging
+    calls never block on I/O.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [logging.StreamHandler(), logging.FileHandler('demo.log')]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    # Drain any queued records before the interpreter exits
+    atexit.register(listener.stop)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
 
 def main():
     """Run the demo."""
@@ -28,9 +39,6 @@ def main():
     configure_logging()
     logger = logging.getLogger(__name__)
 
-    # Load environment variables
-    load_dotenv()
-
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Run a demo of the test generation system')
     parser.add_argument('--srs', type=str, default='data/sample_srs.txt', help='Path to the SRS document')
@@ -38,20 +46,28 @@ def main():
     parser.add_argument('--machine-type', type=str, default='X', choices=['X', 'Y', 'Z', 'A', 'B'], help='Target machine type')
     parser.add_argument('--version', type=str, default='1.0', help='Target version')
     parser.add_argument('--output', type=str, default='output/generated_tests.csv', help='Output file path')
+    parser.add_argument('--concurrency', type=int, default=1, help='Number of parallel LLM requests')
     args = parser.parse_args()
 
+    # Deferred so --help and argument errors skip the dotenv/agent imports
+    from dotenv import load_dotenv
+    from agent.core.agent import TestGenerationAgent
+
+    # Load environment variables
+    load_dotenv()
+
     # Check if files exist
-    if not os.path.exists(args.srs):
+    if not os.path.isfile(args.srs):
         logger.error(f"SRS file not found: {args.srs}")
         return 1
 
-    if not os.path.exists(args.tests):
+    if not os.path.isfile(args.tests):
         logger.error(f"Test cases file not found: {args.tests}")
         return 1
 
     # Create output directory if it doesn't exist
     output_dir = os.path.dirname(args.output)
-    if output_dir and not os.path.exists(output_dir):
+    if output_dir:
         os.makedirs(output_dir, exist_ok=True)
 
     # Create configuration
@@ -59,7 +75,8 @@ def main():
         'llm_provider': os.getenv('LLM_PROVIDER', 'openai'),
         'openai_api_key': os.getenv('OPENAI_API_KEY', 'dummy_key'),
         'anthropic_api_key': os.getenv('ANTHROPIC_API_KEY', 'dummy_key'),
-        'output_dir': os.path.dirname(args.output)
+        'output_dir': os.path.dirname(args.output),
+        'concurrency': args.concurrency
     }
 
     # Check if API key is available
@@ -2,10 +2,10 @@
 Tests for the TestGenerationAgent class.
 """
 
+import csv
 import unittest
 import os
 import tempfile
-import pandas as pd
 from agent.core.agent import TestGenerationAgent
 
 class TestAgent(unittest.TestCase):
@@ -34,29 +34,23 @@ class TestAgent(unittest.TestCase):
             self.srs_file = f.name
 
         # Create a temporary CSV file with sample test cases
-        self.test_data = pd.DataFrame({
-            'Test ID': ['TC-001', 'TC-002', 'TC-003'],
-            'Requirement ID': ['REQ-001', 'REQ-001', 'REQ-002'],
-            'Preconditions': [
-                'System is operational',
-                'User is logged in',
-                'Database is accessible'
-            ],
-            'Test Steps': [
-                '1. Navigate to login page\n2. Enter valid credentials\n3. Click login button',
-                '1. Navigate to login page\n2. Enter invalid credentials\n3. Click login button',
-                '1. Open user profile\n2. Click edit button\n3. Update user information\n4. Save changes'
-            ],
-            'Expected Results': [
-                '1. Login page is displayed\n2. Credentials are accepted\n3. User is logged in successfully',
-                '1. Login page is displayed\n2. Credentials are entered\n3. Error message is displayed',
-                '1. Profile page opens\n2. Edit mode is activated\n3. Information is updated\n4. Changes are saved'
-            ]
-        })
+        self.test_data = [
+            ['TC-001', 'REQ-001', 'System is operational',
+             '1. Navigate to login page\n2. Enter valid credentials\n3. Click login button',
+             '1. Login page is displayed\n2. Credentials are accepted\n3. User is logged in successfully'],
+            ['TC-002', 'REQ-001', 'User is logged in',
+             '1. Navigate to login page\n2. Enter invalid credentials\n3. Click login button',
+             '1. Login page is displayed\n2. Credentials are entered\n3. Error message is displayed'],
+            ['TC-003', 'REQ-002', 'Database is accessible',
+             '1. Open user profile\n2. Click edit button\n3. Update user information\n4. Save changes',
+             '1. Profile page opens\n2. Edit mode is activated\n3. Information is updated\n4. Changes are saved']
+        ]
 
         # Save to a temporary file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            self.test_data.to_csv(f, index=False)
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Test ID', 'Requirement ID', 'Preconditions', 'Test Steps', 'Expected Results'])
+            writer.writerows(self.test_data)
             self.tests_file = f.name
 
     def tearDown(self):
@@ -139,5 +133,41 @@ class TestAgent(unittest.TestCase):
         self.assertTrue(len(test_case['expected_results']) >= 1)
         self.assertTrue('valid credentials' in test_case['preconditions'])
 
+    def test_output_to_csv(self):
+        """Test writing test cases in TFS CSV format."""
+        agent = TestGenerationAgent(self.config)
+
+        test_case = {
+            'id': 'X_TC_1',
+            'requirement_id': 'REQ-001',
+            'preconditions': 'User has valid credentials',
+            'steps': ['Navigate to the login page', 'SHARED_STEP: 42'],
+            'expected_results': ['Login page is displayed', 'User is logged in']
+        }
+
+        output_dir = tempfile.mkdtemp()
+        output_path = os.path.join(output_dir, 'out.csv')
+        try:
+            agent.output_to_csv([test_case], output_path)
+
+            with open(output_path, newline='', encoding='utf-8') as f:
+                rows = list(csv.reader(f))
+
+            # Header, test case, preconditions note and two steps
+            self.assertEqual(rows, [
+                ['ID', 'Work Item type', 'Title', 'Test Step', 'Step Action', 'Step expected'],
+                ['X_TC_1', 'Test case', 'Test for REQ-001', '', '', ''],
+                ['', '', '', '', 'PRECONDITIONS: User has valid credentials', ''],
+                ['', '', '', '1', 'Navigate to the login page', 'Login page is displayed'],
+                ['', '', '', '2', 'Shared action 42', 'User is logged in']
+            ])
+
+            # Rows end with the platform line separator
+            with open(output_path, 'rb') as f:
+                self.assertEqual(f.read().count(os.linesep.encode()), len(rows))
+        finally:
+            os.unlink(output_path)
+            os.rmdir(output_dir)
+
 if __name__ == '__main__':
     unittest.main()
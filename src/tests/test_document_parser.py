@@ -2,25 +2,46 @@
 Tests for the document parser module.
 """
 
+import io
 import unittest
 import os
 import tempfile
-from agent.input.document_parser import DocumentParser, TextParser, get_parser_for_file
+from agent.input.document_parser import (
+    DocumentParser, TextParser, get_parser_for_file, _clear_requirements_cache
+)
+
+# Sample SRS text shared by the text parser tests
+SAMPLE_REQUIREMENTS_TEXT = """
+            REQ-001: The system shall allow users to log in with username and password.
+            
+            REQ-002: The system shall display an error message for invalid login attempts.
+            
+            The system must maintain a log of all login attempts. This is a critical security feature.
+            """
 
 class TestDocumentParser(unittest.TestCase):
     """Test cases for the document parser."""
     
+    def setUp(self):
+        """Start each test with an empty requirements cache."""
+        _clear_requirements_cache()
+    
     def test_text_parser(self):
+        """Test parsing requirements from an in-memory text stream."""
+        parser = TextParser()
+        requirements = parser.parse(io.StringIO(SAMPLE_REQUIREMENTS_TEXT))
+        
+        # Verify the results
+        self.assertEqual(len(requirements), 3)
+        self.assertEqual(requirements[0]['id'], 'REQ-001')
+        self.assertEqual(requirements[1]['id'], 'REQ-002')
+        self.assertTrue('critical' in requirements[2]['tags'])
+    
+    def test_text_parser_from_file(self):
         """Test parsing a text file with requirements."""
         # Create a temporary text file with sample requirements
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            f.write("""
-            REQ-001: The system shall allow users to log in with username and password.
-            
-            REQ-002: The system shall display an error message for invalid login attempts.
-            
-            The system must maintain a log of all login attempts. This is a critical security feature.
-            """)
+            f.write(SAMPLE_REQUIREMENTS_TEXT)
             temp_file = f.name
         
         try:
@@ -38,6 +59,21 @@ class TestDocumentParser(unittest.TestCase):
             # Clean up
             os.unlink(temp_file)
     
+    def test_requirements_cache_returns_copies(self):
+        """Test that a cache hit returns equal but independent requirements."""
+        parser = TextParser()
+        first = parser.parse(io.StringIO(SAMPLE_REQUIREMENTS_TEXT))
+        second = parser.parse(io.StringIO(SAMPLE_REQUIREMENTS_TEXT))
+        
+        self.assertEqual(first, second)
+        self.assertIsNot(first[0], second[0])
+        
+        # Mutating one result must not leak into later parses
+        first[2]['tags'].append('mutated')
+        first[0]['id'] = 'CHANGED'
+        third = parser.parse(io.StringIO(SAMPLE_REQUIREMENTS_TEXT))
+        self.assertEqual(third, second)
+    
     def test_get_parser_for_file(self):
         """Test getting the appropriate parser for different file types."""
         # Test with different file extensions
@@ -66,6 +102,20 @@ class TestDocumentParser(unittest.TestCase):
         self.assertTrue('critical' in critical_tags)
         self.assertTrue('security' in critical_tags)
         self.assertTrue('ui' in ui_tags)
+    
+    def test_extract_tags_whole_words(self):
+        """Test that tag keywords only match whole words."""
+        parser = DocumentParser()
+        
+        # Keywords embedded in longer words do not produce tags
+        self.assertEqual(parser._extract_tags("All requirements are built in a datastore."), [])
+        self.assertEqual(parser._extract_tags("This is critically reviewed."), [])
+        
+        # Standalone keywords still do, and 'critical' outranks 'important'
+        self.assertEqual(
+            parser._extract_tags("A critical and important UI for the database."),
+            ['critical', 'ui', 'data']
+        )
 
 if __name__ == '__main__':
     unittest.main()
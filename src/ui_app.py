@@ -6,14 +6,15 @@ A simple, minimalist GUI for the automated test case generation system.
 
 import os
 import sys
+import queue
+import stat
 import logging
 import threading
+import time
+import textwrap
+from contextlib import contextmanager
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from dotenv import load_dotenv
-
-# Import the agent
-from agent.core.agent import TestGenerationAgent
 
 # Configure logging
 logging.basicConfig(
@@ -26,11 +27,139 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between intermediate progress repaints
+_MIN_UI_INTERVAL = 0.05
+
+# Milliseconds between drains of the worker-to-UI queue
+_UI_POLL_INTERVAL_MS = 50
+
+# Number of progress phases reported by _run_generation
+_GENERATION_PHASES = 6
+
+# Window icon, and a tiny GIF used where the .ico cannot be loaded
+_ICON_PATH = os.path.join("resources", "icon.ico")
+_FALLBACK_ICON_DATA = "R0lGODlhEAAQAIABAAAAAP///yH5BAEKAAEALAAAAAAQABAAAAIjjI+py+0Po5y02ouz3rz7D4biSJbmiabqyrbuC8fyTNf2UQAAOw=="
+
+# File dialog filters for the SRS, existing tests and output pickers
+_SRS_FILETYPES = (
+    ("All Files", "*.*"),
+    ("Text Files", "*.txt"),
+    ("Word Documents", "*.docx"),
+    ("PDF Files", "*.pdf")
+)
+_CSV_FILETYPES = (
+    ("All Files", "*.*"),
+    ("CSV Files", "*.csv")
+)
+_OUTPUT_FILETYPES = (
+    ("CSV Files", "*.csv"),
+    ("All Files", "*.*")
+)
+
+# Platform radio buttons as (value, label) pairs, in display order
+_PLATFORMS = (
+    ("A", "Platform A"),
+    ("B", "Platform B"),
+    ("Z", "Platform Z")
+)
+
+# ttk style options applied in order by _apply_styles
+_STYLE_SPEC = (
+    ("TLabel", {"font": ("Segoe UI", 10)}),
+    # Padding fixes button text display issues
+    ("TButton", {"font": ("Segoe UI", 10), "padding": 6}),
+    ("TRadiobutton", {"font": ("Segoe UI", 10)}),
+    ("TEntry", {"font": ("Segoe UI", 10)}),
+    ("TLabelframe", {"font": ("Segoe UI", 10)}),
+    ("TLabelframe.Label", {"font": ("Segoe UI", 10, "bold"), "foreground": "#2c3e50"}),
+    # Accent button style with better visibility
+    ("Accent.TButton", {
+        "font": ("Segoe UI", 11, "bold"),
+        "padding": 8,
+        "background": "#3498db",
+        "foreground": "#ffffff"
+    }),
+    # Progress bar style
+    ("Accent.Horizontal.TProgressbar", {"background": "#2ecc71"})
+)
+
+# Help dialog texts
+_HELP_TEXT = textwrap.dedent("""
+    Test Case Generator Help
+
+    This application generates test cases from SRS documents based on existing test cases.
+
+    How to use:
+    1. Select an SRS document (Word, PDF, or text file)
+    2. Select existing test cases (CSV file)
+    3. Choose your platform type (A, B, or Z)
+    4. Select the platform version
+    5. Specify the output file location
+    6. Click 'Generate Test Cases'
+
+    For more information, please refer to the documentation.
+    """).strip()
+
+_PLATFORM_HELP = textwrap.dedent("""
+    Platform Type Information
+
+    Select the appropriate platform type for your test cases:
+
+    • Platform A: Used for standard configurations
+      - Features: Basic authentication, standard UI
+      - Naming convention: A_[TestID]_[Version]
+
+    • Platform B: Used for enhanced configurations
+      - Features: Advanced authentication, enhanced UI
+      - Naming convention: B_[TestID]_[Version]
+
+    • Platform Z: Used for specialized configurations
+      - Features: Specialized security, custom UI
+      - Naming convention: Z_[TestID]_[Version]
+
+    The platform type affects the generated test cases and their features.
+    """).strip()
+
+_VERSION_HELP = textwrap.dedent("""
+    Version Information
+
+    Select the appropriate version for your platform:
+
+    • Version 1.0: Base version
+      - Features: Core functionality
+      - File naming: [PlatformType]_[TestID]_1.0
+
+    • Version 2.0: Enhanced version
+      - Features: Advanced functionality, improved security
+      - File naming: [PlatformType]_[TestID]_2.0
+
+    • Version 3.0: Latest version
+      - Features: Complete functionality set, maximum security
+      - File naming: [PlatformType]_[TestID]_3.0
+
+    The version affects which features are tested in the generated test cases.
+    """).strip()
+
+# Contents of the README written into the data directory when missing
+_README_TEXT = textwrap.dedent("""
+    DATA DIRECTORY
+
+    This directory is for storing input files for the Test Case Generator:
+
+    1. SRS Documents (*.txt, *.docx, *.pdf)
+    2. Existing Test Cases (*.csv)
+
+    Place your files in this directory to make them easily accessible from the application.
+    """)
+
 class TestGeneratorApp:
     """
     GUI Application for Test Case Generation
     """
 
+    # Set once .env has been read; it is only loaded once per process
+    _dotenv_loaded = False
+
     def __init__(self, root):
         """Initialize the application."""
         self.root = root
@@ -41,19 +170,8 @@ class TestGeneratorApp:
         # Set background color and title bar icon
         self.root.configure(background='#f0f0f0')
 
-        # Try to set a nice icon for the window
-        try:
-            self.root.iconbitmap(default="resources/icon.ico")
-        except:
-            # If icon not found, try to create a simple icon using a canvas
-            try:
-                icon = tk.PhotoImage(data="""R0lGODlhEAAQAIABAAAAAP///yH5BAEKAAEALAAAAAAQABAAAAIjjI+py+0Po5y02ouz3rz7D4biSJbmiabqyrbuC8fyTNf2UQAAOw==""")
-                self.root.iconphoto(True, icon)
-            except:
-                pass  # If all fails, use default icon
-
-        # Load environment variables
-        load_dotenv()
+        # Set the window icon; .ico files are only understood by Tk on Windows
+        self._set_icon()
 
         # Set up variables
         self.srs_path = tk.StringVar()
@@ -67,12 +185,75 @@ class TestGeneratorApp:
         # Set up the UI
         self._create_ui()
 
+        # Load the file dialog scripts once the window is up
+        self.root.after(100, self._warm_filedialog)
+
+        # Start draining UI updates posted by the worker thread
+        self.root.after(_UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+
+        # Working directories, resolved once against the startup directory
+        self._data_dir = os.path.abspath("data")
+        self._output_dir = os.path.abspath("output")
+
+        # Preferred browse directories known to exist, see _initial_dir
+        self._cached_dirs = set()
+
         # Agent instance (will be created when needed)
         self.agent = None
 
+        # Progress throttling: every update gets a sequence number, the
+        # newest throttled one waits in _pending_progress for the next drain,
+        # and _applied_progress_seq stops older updates from overwriting it
+        self._last_progress_ts = 0.0
+        self._progress_seq = 0
+        self._pending_progress = None
+        self._applied_progress_seq = 0
+
+        # Callbacks posted by the worker thread, run on the Tk thread
+        self._ui_queue = queue.SimpleQueue()
+
+        # Form values captured by the last successful validation
+        self._inputs = None
+
         # Flag for running process
         self.is_running = False
 
+        # Import the agent in the background while the user picks files
+        threading.Thread(target=self._preload_agent, daemon=True).start()
+
+    def _set_icon(self):
+        """Set the window icon, falling back to a small embedded image."""
+        if os.name == 'nt':
+            try:
+                self.root.iconbitmap(default=_ICON_PATH)
+                return
+            except tk.TclError:
+                pass
+
+        # If icon not found (or not on Windows), use an embedded GIF
+        try:
+            icon = tk.PhotoImage(data=_FALLBACK_ICON_DATA)
+            self.root.iconphoto(True, icon)
+        except tk.TclError:
+            pass  # If all fails, use default icon
+
+    def _warm_filedialog(self):
+        """Autoload Tk's file dialog code so the first Browse click opens promptly."""
+        try:
+            # No-op where the dialog is native (Windows, macOS)
+            self.root.tk.call('auto_load', '::tk::dialog::file::')
+        except tk.TclError:
+            pass
+
+    @staticmethod
+    def _preload_agent():
+        """Import the agent package so the first generation does not pay for it."""
+        try:
+            import agent.core.agent  # noqa: F401
+        except Exception as e:
+            # Surface the real error later, when generation imports it again
+            logger.debug(f"Agent preload failed: {str(e)}")
+
     def _create_ui(self):
         """Create the user interface."""
         # Main frame with padding and background
@@ -126,29 +307,9 @@ class TestGeneratorApp:
             command=self._open_data_directory
         ).pack(side=tk.LEFT, padx=(0, 10))
 
-        # SRS file selection
-        srs_frame = ttk.Frame(input_frame)
-        srs_frame.pack(fill=tk.X, pady=5)
-
-        ttk.Label(srs_frame, text="SRS Document:").pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Entry(srs_frame, textvariable=self.srs_path, width=50).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Button(
-            srs_frame,
-            text="Browse...",
-            command=self._browse_srs
-        ).pack(side=tk.LEFT, padx=(10, 0))
-
-        # Existing tests file selection
-        tests_frame = ttk.Frame(input_frame)
-        tests_frame.pack(fill=tk.X, pady=5)
-
-        ttk.Label(tests_frame, text="Existing Tests:").pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Entry(tests_frame, textvariable=self.tests_path, width=50).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Button(
-            tests_frame,
-            text="Browse...",
-            command=self._browse_tests
-        ).pack(side=tk.LEFT, padx=(10, 0))
+        # SRS and existing tests file selection
+        self._make_browse_row(input_frame, "SRS Document:", self.srs_path, self._browse_srs)
+        self._make_browse_row(input_frame, "Existing Tests:", self.tests_path, self._browse_tests)
 
         # Configuration frame with better styling
         config_frame = ttk.LabelFrame(main_frame, text="Configuration", padding="15")
@@ -177,26 +338,13 @@ class TestGeneratorApp:
         radio_frame.pack(side=tk.LEFT, padx=(0, 15), fill=tk.X, expand=True)
 
         # Add radio buttons in a grid layout
-        ttk.Radiobutton(
-            radio_frame,
-            text="Platform A",
-            variable=self.machine_type,
-            value="A"
-        ).grid(row=0, column=0, padx=15, pady=5, sticky=tk.W)
-
-        ttk.Radiobutton(
-            radio_frame,
-            text="Platform B",
-            variable=self.machine_type,
-            value="B"
-        ).grid(row=0, column=1, padx=15, pady=5, sticky=tk.W)
-
-        ttk.Radiobutton(
-            radio_frame,
-            text="Platform Z",
-            variable=self.machine_type,
-            value="Z"
-        ).grid(row=0, column=2, padx=15, pady=5, sticky=tk.W)
+        for column, (value, label) in enumerate(_PLATFORMS):
+            ttk.Radiobutton(
+                radio_frame,
+                text=label,
+                variable=self.machine_type,
+                value=value
+            ).grid(row=0, column=column, padx=15, pady=5, sticky=tk.W)
 
         # Add help button
         help_button = ttk.Button(
@@ -240,16 +388,7 @@ class TestGeneratorApp:
         help_button.pack(side=tk.LEFT)
 
         # Output file selection
-        output_frame = ttk.Frame(config_frame)
-        output_frame.pack(fill=tk.X, pady=5)
-
-        ttk.Label(output_frame, text="Output File:").pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Entry(output_frame, textvariable=self.output_path, width=50).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Button(
-            output_frame,
-            text="Browse...",
-            command=self._browse_output
-        ).pack(side=tk.LEFT, padx=(10, 0))
+        self._make_browse_row(config_frame, "Output File:", self.output_path, self._browse_output)
 
         # Progress frame with better styling
         progress_frame = ttk.LabelFrame(main_frame, text="Progress", padding="15")
@@ -338,6 +477,19 @@ class TestGeneratorApp:
         # Apply styles
         self._apply_styles()
 
+    def _make_browse_row(self, parent, label, variable, command):
+        """Add a label, path entry and Browse button row to a frame."""
+        row_frame = ttk.Frame(parent)
+        row_frame.pack(fill=tk.X, pady=5)
+
+        ttk.Label(row_frame, text=label).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Entry(row_frame, textvariable=variable, width=50).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Button(
+            row_frame,
+            text="Browse...",
+            command=command
+        ).pack(side=tk.LEFT, padx=(10, 0))
+
     def _apply_styles(self):
         """Apply custom styles to the UI."""
         style = ttk.Style()
@@ -348,28 +500,9 @@ class TestGeneratorApp:
         elif "clam" in style.theme_names():
             style.theme_use("clam")
 
-        # Configure colors and fonts
-        style.configure("TLabel", font=("Segoe UI", 10))
-        style.configure("TButton", font=("Segoe UI", 10))
-        style.configure("TRadiobutton", font=("Segoe UI", 10))
-        style.configure("TEntry", font=("Segoe UI", 10))
-        style.configure("TLabelframe", font=("Segoe UI", 10))
-        style.configure("TLabelframe.Label", font=("Segoe UI", 10, "bold"), foreground="#2c3e50")
-
-        # Fix button text display issues
-        style.configure("TButton", padding=6)
-
-        # Accent button style with better visibility
-        style.configure(
-            "Accent.TButton",
-            font=("Segoe UI", 11, "bold"),
-            padding=8,
-            background="#3498db",
-            foreground="#ffffff"
-        )
-
-        # Progress bar style
-        style.configure("Accent.Horizontal.TProgressbar", background="#2ecc71")
+        # Configure colors, fonts and padding
+        for name, options in _STYLE_SPEC:
+            style.configure(name, **options)
 
         # Try to make buttons more visible with map configuration
         style.map('TButton',
@@ -385,23 +518,12 @@ class TestGeneratorApp:
     def _browse_srs(self):
         """Browse for SRS document."""
         # Start in the data directory if it exists
-        initial_dir = os.path.abspath("data") if os.path.exists("data") else os.getcwd()
-
-        # Show a message to help the user
-        messagebox.showinfo(
-            "File Selection",
-            f"Looking for files in: {initial_dir}\n\nIf you don't see your files, please check this directory."
-        )
+        initial_dir = self._initial_dir(self._data_dir)
 
         file_path = filedialog.askopenfilename(
-            title="Select SRS Document",
+            title=f"Select SRS Document - looking in {initial_dir}",
             initialdir=initial_dir,
-            filetypes=[
-                ("All Files", "*.*"),
-                ("Text Files", "*.txt"),
-                ("Word Documents", "*.docx"),
-                ("PDF Files", "*.pdf")
-            ]
+            filetypes=_SRS_FILETYPES
         )
         if file_path:
             self.srs_path.set(file_path)
@@ -409,21 +531,12 @@ class TestGeneratorApp:
     def _browse_tests(self):
         """Browse for existing test cases."""
         # Start in the data directory if it exists
-        initial_dir = os.path.abspath("data") if os.path.exists("data") else os.getcwd()
-
-        # Show a message to help the user
-        messagebox.showinfo(
-            "File Selection",
-            f"Looking for files in: {initial_dir}\n\nIf you don't see your files, please check this directory."
-        )
+        initial_dir = self._initial_dir(self._data_dir)
 
         file_path = filedialog.askopenfilename(
-            title="Select Existing Test Cases",
+            title=f"Select Existing Test Cases - looking in {initial_dir}",
             initialdir=initial_dir,
-            filetypes=[
-                ("All Files", "*.*"),
-                ("CSV Files", "*.csv")
-            ]
+            filetypes=_CSV_FILETYPES
         )
         if file_path:
             self.tests_path.set(file_path)
@@ -431,20 +544,37 @@ class TestGeneratorApp:
     def _browse_output(self):
         """Browse for output file location."""
         # Start in the output directory if it exists
-        initial_dir = "output" if os.path.exists("output") else os.getcwd()
+        initial_dir = self._initial_dir(self._output_dir)
 
         file_path = filedialog.asksaveasfilename(
             title="Save Generated Test Cases",
             initialdir=initial_dir,
             defaultextension=".csv",
-            filetypes=[
-                ("CSV Files", "*.csv"),
-                ("All Files", "*.*")
-            ]
+            filetypes=_OUTPUT_FILETYPES
         )
         if file_path:
             self.output_path.set(file_path)
 
+    def _initial_dir(self, preferred_dir):
+        """
+        Get the directory a file dialog should open in.
+
+        Only a directory that exists is cached, so one created later (by
+        validation or the data directory button) is picked up next time.
+
+        Args:
+            preferred_dir: Absolute directory to use if it exists
+
+        Returns:
+            preferred_dir, or the current directory if it does not exist
+        """
+        if preferred_dir in self._cached_dirs:
+            return preferred_dir
+        if os.path.isdir(preferred_dir):
+            self._cached_dirs.add(preferred_dir)
+            return preferred_dir
+        return os.getcwd()
+
     def _generate_tests(self):
         """Generate test cases."""
         # Validate inputs
@@ -460,98 +590,224 @@ class TestGeneratorApp:
         threading.Thread(target=self._run_generation, daemon=True).start()
 
     def _validate_inputs(self):
-        """Validate user inputs."""
+        """
+        Validate user inputs.
+
+        The entry values are read once and stashed on ``self._inputs`` so the
+        worker thread uses exactly what was validated, even if the user edits
+        the fields while generation runs.
+        """
+        # Snapshot the form in one pass
+        srs_path = self.srs_path.get()
+        tests_path = self.tests_path.get()
+        output_path = self.output_path.get()
+        output_dir = os.path.dirname(output_path)
+
         # Check SRS path
-        if not self.srs_path.get():
+        if not srs_path:
             messagebox.showerror("Error", "Please select an SRS document.")
             return False
 
-        if not os.path.exists(self.srs_path.get()):
+        try:
+            srs_stat = os.stat(srs_path)
+        except FileNotFoundError:
             messagebox.showerror("Error", "SRS document not found.")
             return False
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not access SRS document: {str(e)}")
+            return False
+
+        if not stat.S_ISREG(srs_stat.st_mode):
+            messagebox.showerror("Error", "SRS document path is not a regular file.")
+            return False
 
         # Check tests path
-        if not self.tests_path.get():
+        if not tests_path:
             messagebox.showerror("Error", "Please select existing test cases.")
             return False
 
-        if not os.path.exists(self.tests_path.get()):
+        try:
+            tests_stat = os.stat(tests_path)
+        except FileNotFoundError:
             messagebox.showerror("Error", "Existing test cases file not found.")
             return False
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not access existing test cases file: {str(e)}")
+            return False
+
+        if not stat.S_ISREG(tests_stat.st_mode):
+            messagebox.showerror("Error", "Existing test cases path is not a regular file.")
+            return False
 
         # Check output path
-        output_dir = os.path.dirname(self.output_path.get())
-        if output_dir and not os.path.exists(output_dir):
+        if output_dir:
             try:
                 os.makedirs(output_dir, exist_ok=True)
             except Exception as e:
                 messagebox.showerror("Error", f"Could not create output directory: {str(e)}")
                 return False
 
+        self._inputs = {
+            'srs_path': srs_path,
+            'tests_path': tests_path,
+            'output_path': output_path,
+            'output_dir': output_dir,
+            'machine_type': self.machine_type.get(),
+            'version': self.version.get()
+        }
         return True
 
     def _run_generation(self):
         """Run the test case generation process."""
+        inputs = self._inputs
         try:
-            # Update progress
-            self._update_progress(0, "Initializing...")
-
-            # Create configuration
-            config = {
-                'llm_provider': os.getenv('LLM_PROVIDER', 'openai'),
-                'openai_api_key': os.getenv('OPENAI_API_KEY', 'dummy_key'),
-                'anthropic_api_key': os.getenv('ANTHROPIC_API_KEY', 'dummy_key'),
-                'output_dir': os.path.dirname(self.output_path.get())
-            }
-
-            # Create the agent
-            self._update_progress(10, "Creating agent...")
-            self.agent = TestGenerationAgent(config)
-
-            # Process the SRS
-            self._update_progress(20, "Processing SRS document...")
-            requirements = self.agent.process_srs(self.srs_path.get())
-
-            # Learn from existing tests
-            self._update_progress(40, "Learning from existing tests...")
-            self.agent.learn_from_existing_tests(self.tests_path.get())
-
-            # Generate test cases
-            self._update_progress(60, "Generating test cases...")
-            test_cases = self.agent.generate_test_cases(
-                requirements,
-                self.machine_type.get(),
-                self.version.get()
-            )
-
-            # Output to CSV
-            self._update_progress(80, "Writing test cases to CSV...")
-            self.agent.output_to_csv(test_cases, self.output_path.get())
-
-            # Complete
-            self._update_progress(100, "Test case generation complete!")
+            with self._progress_batch(_GENERATION_PHASES, "Test case generation complete!") as tick:
+                tick("Initializing...")
+
+                # Import here so the window does not wait on the agent's dependencies
+                from dotenv import load_dotenv
+                from agent.core.agent import TestGenerationAgent
+
+                # Load environment variables
+                if not TestGeneratorApp._dotenv_loaded:
+                    load_dotenv()
+                    TestGeneratorApp._dotenv_loaded = True
+
+                # Create configuration
+                config = {
+                    'llm_provider': os.getenv('LLM_PROVIDER', 'openai'),
+                    'openai_api_key': os.getenv('OPENAI_API_KEY', 'dummy_key'),
+                    'anthropic_api_key': os.getenv('ANTHROPIC_API_KEY', 'dummy_key'),
+                    'output_dir': inputs['output_dir']
+                }
+
+                # Create the agent
+                tick("Creating agent...")
+                self.agent = TestGenerationAgent(config)
+
+                # Process the SRS
+                tick("Processing SRS document...")
+                requirements = self.agent.process_srs(inputs['srs_path'])
+
+                # Learn from existing tests
+                tick("Learning from existing tests...")
+                self.agent.learn_from_existing_tests(inputs['tests_path'])
+
+                # Generate test cases
+                tick("Generating test cases...")
+                test_cases = self.agent.generate_test_cases(
+                    requirements,
+                    inputs['machine_type'],
+                    inputs['version']
+                )
+
+                # Output to CSV
+                tick("Writing test cases to CSV...")
+                self.agent.output_to_csv(test_cases, inputs['output_path'])
 
             # Show success message
-            self.root.after(0, lambda: messagebox.showinfo(
+            self._post_to_ui(
+                messagebox.showinfo,
                 "Success",
-                f"Generated {len(test_cases)} test cases successfully!\n\nOutput file: {self.output_path.get()}"
-            ))
+                f"Generated {len(test_cases)} test cases successfully!\n\nOutput file: {inputs['output_path']}"
+            )
 
         except Exception as e:
             logger.error(f"Error during test generation: {str(e)}", exc_info=True)
-            self.root.after(0, lambda: messagebox.showerror("Error", f"An error occurred: {str(e)}"))
-            self._update_progress(0, "Error occurred")
+            self._post_to_ui(messagebox.showerror, "Error", f"An error occurred: {str(e)}")
 
         finally:
             # Re-enable generate button and disable cancel button
-            self.root.after(0, lambda: self.generate_button.config(state=tk.NORMAL))
-            self.root.after(0, lambda: self.cancel_button.config(state=tk.DISABLED))
+            self._post_to_ui(self._reset_buttons)
             self.is_running = False
 
     def _update_progress(self, value, text):
-        """Update the progress bar and text."""
-        self.root.after(0, lambda: self.progress_value.set(value))
-        self.root.after(0, lambda: self.progress_text.set(text))
+        """
+        Update the progress bar and text.
+
+        Intermediate updates arriving within _MIN_UI_INTERVAL of the last
+        one shown are held back, keeping only the newest; the next queue
+        drain shows it. Start (0) and finish (100) are always queued.
+        """
+        self._progress_seq += 1
+        update = (self._progress_seq, value, text)
+
+        now = time.monotonic()
+        if 0 < value < 100 and now - self._last_progress_ts < _MIN_UI_INTERVAL:
+            self._pending_progress = update
+            return
+        self._last_progress_ts = now
+        self._pending_progress = None
+
+        self._post_to_ui(self._apply_progress, *update)
+
+    @contextmanager
+    def _progress_batch(self, total, done_text):
+        """
+        Report progress for a fixed number of sequential phases.
+
+        The bar is set to 100% with done_text when the block completes, and
+        reset to 0 with an error message if it raises.
+
+        Args:
+            total: Number of phases in the batch
+            done_text: Progress text shown once every phase has finished
+
+        Yields:
+            A tick(text) function to call as each phase starts; the bar is
+            set to the share of phases already finished
+        """
+        completed = 0
+
+        def tick(text):
+            nonlocal completed
+            self._update_progress(completed * 100 / total, text)
+            completed += 1
+
+        try:
+            yield tick
+        except Exception:
+            self._update_progress(0, "Error occurred")
+            raise
+        self._update_progress(100, done_text)
+
+    def _apply_progress(self, seq, value, text):
+        """Set the progress bar and text together on the Tk thread."""
+        # A held-back update can be flushed after a newer one was shown
+        if seq <= self._applied_progress_seq:
+            return
+        self._applied_progress_seq = seq
+        self.progress_value.set(value)
+        self.progress_text.set(text)
+
+    def _post_to_ui(self, callback, *args):
+        """Queue a callback to run on the Tk thread at the next drain."""
+        self._ui_queue.put((callback, args))
+
+    def _drain_ui_queue(self):
+        """Run every queued UI callback, then re-arm the poller."""
+        try:
+            while True:
+                callback, args = self._ui_queue.get_nowait()
+                try:
+                    callback(*args)
+                except Exception as e:
+                    logger.error(f"UI update failed: {str(e)}", exc_info=True)
+        except queue.Empty:
+            pass
+
+        # Show the newest progress update the throttle held back
+        pending = self._pending_progress
+        if pending is not None:
+            self._pending_progress = None
+            self._apply_progress(*pending)
+
+        self.root.after(_UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+
+    def _reset_buttons(self):
+        """Re-enable the generate button and disable the cancel button."""
+        self.generate_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
 
     def _cancel(self):
         """Cancel the generation process."""
@@ -563,99 +819,32 @@ class TestGeneratorApp:
 
         # Update UI
         self._update_progress(0, "Cancelled")
-        self.generate_button.config(state=tk.NORMAL)
-        self.cancel_button.config(state=tk.DISABLED)
+        self._reset_buttons()
 
         messagebox.showinfo("Cancelled", "Test case generation was cancelled.")
 
     def _show_help(self):
         """Show help information."""
-        help_text = """
-        Test Case Generator Help
-
-        This application generates test cases from SRS documents based on existing test cases.
-
-        How to use:
-        1. Select an SRS document (Word, PDF, or text file)
-        2. Select existing test cases (CSV file)
-        3. Choose your platform type (A, B, or Z)
-        4. Select the platform version
-        5. Specify the output file location
-        6. Click 'Generate Test Cases'
-
-        For more information, please refer to the documentation.
-        """
-
-        messagebox.showinfo("Help", help_text)
+        messagebox.showinfo("Help", _HELP_TEXT)
 
     def _show_platform_help(self):
         """Show help about platform types."""
-        platform_help = """
-        Platform Type Information
-
-        Select the appropriate platform type for your test cases:
-
-        • Platform A: Used for standard configurations
-          - Features: Basic authentication, standard UI
-          - Naming convention: A_[TestID]_[Version]
-
-        • Platform B: Used for enhanced configurations
-          - Features: Advanced authentication, enhanced UI
-          - Naming convention: B_[TestID]_[Version]
-
-        • Platform Z: Used for specialized configurations
-          - Features: Specialized security, custom UI
-          - Naming convention: Z_[TestID]_[Version]
-
-        The platform type affects the generated test cases and their features.
-        """
-
-        messagebox.showinfo("Platform Types", platform_help)
+        messagebox.showinfo("Platform Types", _PLATFORM_HELP)
 
     def _show_version_help(self):
         """Show help about versions."""
-        version_help = """
-        Version Information
-
-        Select the appropriate version for your platform:
-
-        • Version 1.0: Base version
-          - Features: Core functionality
-          - File naming: [PlatformType]_[TestID]_1.0
-
-        • Version 2.0: Enhanced version
-          - Features: Advanced functionality, improved security
-          - File naming: [PlatformType]_[TestID]_2.0
-
-        • Version 3.0: Latest version
-          - Features: Complete functionality set, maximum security
-          - File naming: [PlatformType]_[TestID]_3.0
-
-        The version affects which features are tested in the generated test cases.
-        """
-
-        messagebox.showinfo("Version Information", version_help)
+        messagebox.showinfo("Version Information", _VERSION_HELP)
 
     def _open_data_directory(self):
         """Open the data directory in the file explorer."""
-        # Create the data directory if it doesn't exist
-        data_dir = os.path.abspath("data")
-        if not os.path.exists(data_dir):
+        # Create the data directory and its README if they are missing
+        data_dir = self._data_dir
+        readme_path = os.path.join(data_dir, "README.txt")
+        if not os.path.isdir(data_dir):
             os.makedirs(data_dir, exist_ok=True)
-
-            # Create a README file in the data directory
-            readme_path = os.path.join(data_dir, "README.txt")
+        if not os.path.isfile(readme_path):
             with open(readme_path, "w") as f:
-                f.write("""
-                DATA DIRECTORY
-
-                This directory is for storing input files for the Test Case Generator:
-
-                1. SRS Documents (*.txt, *.docx, *.pdf)
-                2. Existing Test Cases (*.csv)
-
-                Place your files in this directory to make them easily accessible from the application.
-                """)
+                f.write(_README_TEXT)
 
         # Open the directory in the file explorer
         try:
@@ -675,12 +864,6 @@ def main():
     # Create the root window
     root = tk.Tk()
 
-    # Set application icon
-    try:
-        root.iconbitmap("resources/icon.ico")
-    except:
-        pass  # Icon not found, use default
-
     # Create the application
     app = TestGeneratorApp(root)
 